@@ -5,9 +5,15 @@ from strands import Agent
 from strands.models import BedrockModel
 from strands.tools.mcp import MCPClient
 from mcp.client.streamable_http import streamablehttp_client
+import asyncio
+import os
+import time
+from functools import lru_cache
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import boto3
-from scripts.utils import get_ssm_parameter, get_cognito_client_secret
+from scripts.utils import get_ssm_parameters, get_cognito_client_secret
 from lab_helpers.lab1_strands_agent import (
     get_return_policy,
     get_product_info,
@@ -24,10 +30,24 @@ from lab_helpers.lab2_memory import (
 # Lab1 import: Create the Bedrock model
 model = BedrockModel(model_id=MODEL_ID)
 
-# Lab2 import : Initialize memory via hooks
-memory_id = get_ssm_parameter("/app/customersupport/agentcore/memory_id")
-memory_hooks = CustomerSupportMemoryHooks(
-    memory_id, memory_client, ACTOR_ID, SESSION_ID
+# Shared HTTP session so token refreshes reuse the keep-alive pool instead of
+# opening a fresh TCP+TLS connection each time; retries cover transient
+# errors. POST must be opted into urllib3's allowed methods for the
+# status-based retries to apply to the token request - safe here because the
+# client-credentials grant is idempotent
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+        ),
+    ),
 )
 
 # Lab3 import: Set up gateway client for MCP tools
@@ -41,43 +61,131 @@ def get_token(client_id: str, client_secret: str, scope_string: str, url: str) -
             "client_secret": client_secret,
             "scope": scope_string,
         }
-        response = requests.post(url, headers=headers, data=data)
+        response = _SESSION.post(url, headers=headers, data=data, timeout=(3, 10))
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as err:
         return {"error": str(err)}
 
-# Get gateway access token
-gateway_access_token = get_token(
-    get_ssm_parameter("/app/customersupport/agentcore/machine_client_id"),
-    get_cognito_client_secret(),
-    get_ssm_parameter("/app/customersupport/agentcore/cognito_auth_scope"),
-    get_ssm_parameter("/app/customersupport/agentcore/cognito_token_url")
+# Resolve the region once from the environment when possible and share a
+# single session for all clients, so the credential chain is walked once per
+# cold start instead of once per client
+_BOTO_SESSION = boto3.session.Session()
+_REGION = (
+    os.environ.get("AWS_REGION")
+    or os.environ.get("AWS_DEFAULT_REGION")
+    or _BOTO_SESSION.region_name
 )
 
-# Get gateway URL from SSM
-gateway_id = get_ssm_parameter("/app/customersupport/agentcore/gateway_id")
-gateway_client = boto3.client("bedrock-agentcore-control", region_name=boto3.session.Session().region_name)
-gateway_response = gateway_client.get_gateway(gatewayIdentifier=gateway_id)
-gateway_url = gateway_response["gatewayUrl"]
+gateway_client = _BOTO_SESSION.client("bedrock-agentcore-control", region_name=_REGION)
+
+# Overlap the init-time network calls (SSM reads, Cognito client secret,
+# gateway lookup, token POST) so cold-start latency is max(RTT) not sum(RTT)
+_SSM_PARAM_NAMES = [
+    "/app/customersupport/agentcore/memory_id",
+    "/app/customersupport/agentcore/machine_client_id",
+    "/app/customersupport/agentcore/cognito_auth_scope",
+    "/app/customersupport/agentcore/cognito_token_url",
+    "/app/customersupport/agentcore/gateway_id",
+]
+
+async def get_token_async(client_id: str, client_secret: str, scope_string: str, url: str) -> dict:
+    """Fetch the OAuth token without blocking the event loop"""
+    return await asyncio.to_thread(get_token, client_id, client_secret, scope_string, url)
+
+async def _bootstrap():
+    """Gather the independent init-time I/O concurrently.
+
+    Stage one runs a single batched SSM read alongside the Cognito
+    client-secret lookup;
+    stage two runs the gateway lookup and token POST in parallel once the
+    parameters they depend on have resolved.
+    """
+    params, client_secret = await asyncio.gather(
+        asyncio.to_thread(get_ssm_parameters, _SSM_PARAM_NAMES),
+        asyncio.to_thread(get_cognito_client_secret),
+    )
 
-# Set up MCP client for gateway tools
+    gateway_response, token = await asyncio.gather(
+        asyncio.to_thread(
+            gateway_client.get_gateway,
+            gatewayIdentifier=params["/app/customersupport/agentcore/gateway_id"],
+        ),
+        get_token_async(
+            params["/app/customersupport/agentcore/machine_client_id"],
+            client_secret,
+            params["/app/customersupport/agentcore/cognito_auth_scope"],
+            params["/app/customersupport/agentcore/cognito_token_url"],
+        ),
+    )
+    return params, gateway_response["gatewayUrl"], client_secret, token
+
+class TokenProvider:
+    """Caches the gateway OAuth token and refreshes it shortly before expiry.
+
+    Without this the token fetched at import time eventually expires and the
+    runtime starts failing gateway calls until the container is recycled.
+    """
+
+    _REFRESH_SKEW = 0.2  # refresh at ~80% of the token lifetime
+
+    def __init__(self, client_id: str, client_secret: str, scope_string: str,
+                 url: str, initial_token: dict = None):
+        self._client_id = client_id
+        self._client_secret = client_secret
+        self._scope_string = scope_string
+        self._url = url
+        self._token = None
+        self._expires_at = 0.0
+        if initial_token and "access_token" in initial_token:
+            self._store(initial_token)
+
+    def _store(self, token: dict):
+        self._token = token
+        expires_in = float(token.get("expires_in", 300))
+        self._expires_at = time.time() + expires_in * (1 - self._REFRESH_SKEW)
+
+    def get(self) -> dict:
+        """Return a valid token, re-fetching it if the cached one is stale"""
+        if self._token is None or time.time() >= self._expires_at:
+            token = get_token(
+                self._client_id, self._client_secret, self._scope_string, self._url
+            )
+            if "access_token" not in token:
+                # Don't cache a failed fetch - raising here lets the next
+                # call retry instead of serving the error dict until the
+                # bogus expiry passes
+                raise RuntimeError(
+                    f"Failed to refresh gateway token: {token.get('error', token)}"
+                )
+            self._store(token)
+        return self._token
+
+_params, gateway_url, _cognito_client_secret, _initial_token = asyncio.run(_bootstrap())
+
+token_provider = TokenProvider(
+    _params["/app/customersupport/agentcore/machine_client_id"],
+    _cognito_client_secret,
+    _params["/app/customersupport/agentcore/cognito_auth_scope"],
+    _params["/app/customersupport/agentcore/cognito_token_url"],
+    initial_token=_initial_token,
+)
+
+# Lab2 import : Initialize memory via hooks
+memory_id = _params["/app/customersupport/agentcore/memory_id"]
+memory_hooks = CustomerSupportMemoryHooks(
+    memory_id, memory_client, ACTOR_ID, SESSION_ID
+)
+
+# Set up MCP client for gateway tools - the bearer token is resolved lazily
+# per connection so reconnects pick up a refreshed token
 mcp_client = MCPClient(
     lambda: streamablehttp_client(
         gateway_url,
-        headers={"Authorization": f"Bearer {gateway_access_token['access_token']}"},
+        headers={"Authorization": f"Bearer {token_provider.get()['access_token']}"},
     )
 )
 
-# Initialize MCP client
-try:
-    mcp_client.start()
-except Exception as e:
-    print(f"Error initializing MCP client: {str(e)}")
-
-# Combine local tools with gateway tools
-tools = [get_return_policy, get_product_info] + mcp_client.list_tools_sync()
-
 # Customer Service Assistant system prompt for runtime
 CUSTOMER_SERVICE_SYSTEM_PROMPT = """You are a helpful and professional Customer Service Assistant for an electronics e-commerce company.
 Your role is to:
@@ -95,13 +203,26 @@ You have access to the following tools:
 
 Always use the appropriate tool to get accurate, up-to-date information rather than making assumptions about products, policies, or order status."""
 
-# Create the Customer Service Assistant agent with all tools (local + gateway)
-agent = Agent(
-    model=model,
-    tools=tools,  # Includes both local tools and gateway tools from MCP client
-    system_prompt=CUSTOMER_SERVICE_SYSTEM_PROMPT,
-    hooks=[memory_hooks],
-)
+# Starting the MCP client and listing the gateway tools are remote calls, so
+# they are deferred to the first request instead of blocking container init;
+# lru_cache makes the initialization idempotent across warm invocations
+@lru_cache(maxsize=1)
+def _get_agent() -> Agent:
+    """Create the Customer Service Assistant agent with all tools (local + gateway)"""
+    try:
+        mcp_client.start()
+    except Exception as e:
+        print(f"Error initializing MCP client: {str(e)}")
+
+    # Combine local tools with gateway tools
+    tools = [get_return_policy, get_product_info] + mcp_client.list_tools_sync()
+
+    return Agent(
+        model=model,
+        tools=tools,  # Includes both local tools and gateway tools from MCP client
+        system_prompt=CUSTOMER_SERVICE_SYSTEM_PROMPT,
+        hooks=[memory_hooks],
+    )
 
 # Initialize the AgentCore Runtime App
 app = BedrockAgentCoreApp()  #### AGENTCORE RUNTIME - LINE 2 ####
@@ -112,7 +233,8 @@ def invoke(payload):
     """AgentCore Runtime entrypoint function"""
     user_input = payload.get("prompt", "")
 
-    # Invoke the agent
+    # Invoke the agent (built lazily on the first request)
+    agent = _get_agent()
     response = agent(user_input)
     return response.message["content"][0]["text"]
 
@@ -1,6 +1,14 @@
+import logging
+import os
+
 from track_order import track_order
 from get_customer_profile import get_customer_profile
 
+# Raw event/context logging stays at DEBUG so the formatting cost (and the
+# PII in the event payload) is skipped unless explicitly enabled
+logger = logging.getLogger()
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
 
 def get_named_parameter(event, name):
     if name not in event:
@@ -9,68 +17,69 @@ def get_named_parameter(event, name):
     return event.get(name)
 
 
+def _handle_get_customer_profile(event):
+    customer_id = get_named_parameter(event=event, name="customer_id")
+    email = get_named_parameter(event=event, name="email")
+    phone = get_named_parameter(event=event, name="phone")
+
+    if not customer_id:
+        return 400, "[CROSS MARK] Please provide customer_id"
+
+    customer_profile = get_customer_profile(
+        customer_id=customer_id, email=email, phone=phone
+    )
+    return 200, f"[BUST IN SILHOUETTE] Customer Profile Information: {customer_profile}"
+
+
+def _handle_track_order(event):
+    order_id = get_named_parameter(event=event, name="order_id")
+    tracking_id = get_named_parameter(event=event, name="tracking_id")
+    customer_id = get_named_parameter(event=event, name="customer_id")
+    natural_query = get_named_parameter(event=event, name="natural_query")
+
+    order_status = track_order(
+        order_id=order_id,
+        tracking_id=tracking_id,
+        customer_id=customer_id,
+        natural_query=natural_query,
+    )
+    return 200, order_status
+
+
+# Tool name -> handler, so dispatch is a dict lookup and the error wrapping
+# and response envelope live in one place as more gateway tools are added
+_HANDLERS = {
+    "get_customer_profile": _handle_get_customer_profile,
+    "track_order": _handle_track_order,
+}
+
+
 def lambda_handler(event, context):
-    print(f"Event: {event}")
-    print(f"Context: {context}")
+    logger.debug("Event: %s", event)
+    logger.debug("Context: %s", context)
 
     extended_tool_name = context.client_context.custom["bedrockAgentCoreToolName"]
     resource = extended_tool_name.split("___")[1]
 
-    print(resource)
-
-    if resource == "get_customer_profile":
-        customer_id = get_named_parameter(event=event, name="customer_id")
-        email = get_named_parameter(event=event, name="email")
-        phone = get_named_parameter(event=event, name="phone")
-
-        if not customer_id:
-            return {
-                "statusCode": 400,
-                "body": "[CROSS MARK] Please provide customer_id",
-            }
-
-        try:
-            customer_profile = get_customer_profile(
-                customer_id=customer_id, email=email, phone=phone
-            )
-        except Exception as e:
-            print(e)
-            return {
-                "statusCode": 400,
-                "body": f"[CROSS MARK] {e}",
-            }
+    logger.info("Dispatching tool: %s", resource)
 
+    handler = _HANDLERS.get(resource)
+    if handler is None:
         return {
-            "statusCode": 200,
-            "body": f"[BUST IN SILHOUETTE] Customer Profile Information: {customer_profile}",
+            "statusCode": 400,
+            "body": f"[CROSS MARK] Unknown toolname: {resource}",
         }
 
-    elif resource == "track_order":
-        order_id = get_named_parameter(event=event, name="order_id")
-        tracking_id = get_named_parameter(event=event, name="tracking_id")
-        customer_id = get_named_parameter(event=event, name="customer_id")
-        natural_query = get_named_parameter(event=event, name="natural_query")
-
-        try:
-            order_status = track_order(
-                order_id=order_id,
-                tracking_id=tracking_id,
-                customer_id=customer_id,
-                natural_query=natural_query
-            )
-        except Exception as e:
-            print(e)
-            return {
-                "statusCode": 400,
-                "body": f"[CROSS MARK] {e}",
-            }
-
+    try:
+        status_code, body = handler(event)
+    except Exception as e:
+        logger.exception("Tool %s failed", resource)
         return {
-            "statusCode": 200,
-            "body": order_status,
+            "statusCode": 400,
+            "body": f"[CROSS MARK] {e}",
         }
 
     return {
-        "statusCode": 400,
-        "body": f"[CROSS MARK] Unknown toolname: {resource}",
+        "statusCode": status_code,
+        "body": body,
     }
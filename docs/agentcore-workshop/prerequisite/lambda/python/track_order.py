@@ -1,55 +1,110 @@
 import boto3
+import heapq
 import json
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import re
 from typing import Optional, Dict, List, Any
 
-# Initialize DynamoDB client
-dynamodb = boto3.resource('dynamodb')
-ssm = boto3.client('ssm')
+# Initialize the low-level DynamoDB client with TCP keep-alive so warm
+# invocations reuse sockets instead of paying a fresh TLS handshake per call.
+# The client skips the resource layer's per-item attribute marshalling and
+# has a smaller import footprint on cold start.
+_boto_config = Config(tcp_keepalive=True, retries={'mode': 'standard'})
+ddb = boto3.client('dynamodb', config=_boto_config)
+ssm = boto3.client('ssm', config=_boto_config)
 
-def get_order_tracking_table():
+ORDER_TABLE_PARAM = '/app/customersupport/dynamodb/order_tracking_table_name'
+
+def get_order_tracking_table_name() -> str:
     """Get the order tracking table name from SSM parameter"""
     try:
-        response = ssm.get_parameter(
-            Name='/app/customersupport/dynamodb/order_tracking_table_name'
-        )
-        table_name = response['Parameter']['Value']
-        return dynamodb.Table(table_name)
+        response = ssm.get_parameter(Name=ORDER_TABLE_PARAM)
+        return response['Parameter']['Value']
     except Exception as e:
         raise Exception(f"Failed to get order tracking table: {str(e)}")
 
+# Resolve the table name once at import time so warm invocations skip the SSM
+# round-trip; if SSM is unavailable during init, fall back to lazy lookup
+try:
+    ORDER_TABLE_NAME = get_order_tracking_table_name()
+except Exception:
+    ORDER_TABLE_NAME = None
+
+def _get_order_table_name() -> str:
+    """Return the cached table name, initializing lazily if needed"""
+    global ORDER_TABLE_NAME
+    if ORDER_TABLE_NAME is None:
+        ORDER_TABLE_NAME = get_order_tracking_table_name()
+    return ORDER_TABLE_NAME
+
+_deserializer = TypeDeserializer()
+
+def _deserialize_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a low-level DynamoDB item into plain Python values"""
+    return {key: _deserializer.deserialize(value) for key, value in item.items()}
+
+def _collect_pages(operation, **kwargs) -> List[Dict[str, Any]]:
+    """Run a query/scan operation, following LastEvaluatedKey pagination"""
+    items = []
+    while True:
+        response = operation(**kwargs)
+        items.extend(_deserialize_item(item) for item in response.get('Items', []))
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return items
+        kwargs['ExclusiveStartKey'] = last_key
+
+# Precompiled date patterns so parse_relative_date doesn't rebuild them per call
+_DAYS_OF_WEEK = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+}
+
+_LAST_DAY_PATTERNS = {
+    day: re.compile(rf'last\s+{day}') for day in _DAYS_OF_WEEK
+}
+
+# Common product keywords to search for
+_PRODUCT_KEYWORDS = [
+    'iphone', 'macbook', 'airpods', 'ipad', 'watch', 'tv', 'headphones',
+    'laptop', 'phone', 'tablet', 'console', 'playstation', 'xbox'
+]
+
+# Single alternation pattern so finding every keyword in a string is one
+# linear pass instead of one substring scan per keyword
+_KEYWORD_PATTERN = re.compile(
+    r'\b(' + '|'.join(map(re.escape, _PRODUCT_KEYWORDS)) + r')\b'
+)
+
+_TIME_PATTERNS = [
+    (re.compile(r'(\d+)\s+days?\s+ago'), 'days'),
+    (re.compile(r'(\d+)\s+weeks?\s+ago'), 'weeks'),
+    (re.compile(r'(\d+)\s+months?\s+ago'), 'months'),
+    (re.compile(r'yesterday'), 'yesterday'),
+    (re.compile(r'last\s+week'), 'last_week'),
+    (re.compile(r'last\s+month'), 'last_month')
+]
+
 def parse_relative_date(date_string: str) -> Optional[str]:
     """Parse relative date strings like 'last Friday', 'two weeks ago' into ISO date format"""
     today = datetime.now()
     date_string = date_string.lower().strip()
-    
+
     # Handle "last [day of week]"
-    days_of_week = {
-        'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-        'friday': 4, 'saturday': 5, 'sunday': 6
-    }
-    
-    for day_name, day_num in days_of_week.items():
-        if f"last {day_name}" in date_string:
+    for day_name, day_num in _DAYS_OF_WEEK.items():
+        if _LAST_DAY_PATTERNS[day_name].search(date_string):
             days_back = (today.weekday() - day_num) % 7
             if days_back == 0:  # If today is the same day, go back a week
                 days_back = 7
             target_date = today - timedelta(days=days_back)
             return target_date.strftime('%Y-%m-%d')
-    
+
     # Handle "X days/weeks/months ago"
-    time_patterns = [
-        (r'(\d+)\s+days?\s+ago', 'days'),
-        (r'(\d+)\s+weeks?\s+ago', 'weeks'),
-        (r'(\d+)\s+months?\s+ago', 'months'),
-        (r'yesterday', 'yesterday'),
-        (r'last\s+week', 'last_week'),
-        (r'last\s+month', 'last_month')
-    ]
-    
-    for pattern, unit in time_patterns:
-        match = re.search(pattern, date_string)
+    for pattern, unit in _TIME_PATTERNS:
+        match = pattern.search(date_string)
         if match:
             if unit == 'yesterday':
                 target_date = today - timedelta(days=1)
@@ -70,76 +125,113 @@ def parse_relative_date(date_string: str) -> Optional[str]:
     
     return None
 
-def search_orders_by_natural_query(natural_query: str, customer_id: Optional[str] = None) -> List[Dict[str, Any]]:
-    """Search orders using natural language query"""
-    table = get_order_tracking_table()
-    
+def search_orders_by_natural_query(natural_query: str, customer_id: Optional[str] = None,
+                                   limit: int = 5) -> List[Dict[str, Any]]:
+    """Search orders using natural language query, returning the top matches"""
+    table_name = _get_order_table_name()
+
     # Extract potential product names and dates from the query
     query_lower = natural_query.lower()
     
     # Try to parse dates from the query
     parsed_date = parse_relative_date(query_lower)
-    
-    # Common product keywords to search for
-    product_keywords = [
-        'iphone', 'macbook', 'airpods', 'ipad', 'watch', 'tv', 'headphones',
-        'laptop', 'phone', 'tablet', 'console', 'playstation', 'xbox'
-    ]
-    
+
+    # Precompute query-side matching structures once, outside the per-order loop
+    query_keyword_hits = set(_KEYWORD_PATTERN.findall(query_lower))
+    query_keywords = sorted(query_keyword_hits)
+    query_tokens = {w for w in query_lower.split() if len(w) > 3}
+
     matching_orders = []
-    
+    orders = None
+
+    # Only the fields used for matching and the multi-match listing - the
+    # projection keeps payload bytes (and deserialization) proportional to
+    # what the search actually reads
+    search_projection = {
+        'ProjectionExpression': 'order_id, product_name, order_date, #s, tracking_id',
+        'ExpressionAttributeNames': {'#s': 'status'},
+    }
+
     if customer_id:
         # Search by customer ID first
         try:
-            response = table.query(
+            orders = _collect_pages(
+                ddb.query,
+                TableName=table_name,
                 IndexName='customer-index',
                 KeyConditionExpression='customer_id = :customer_id',
-                ExpressionAttributeValues={':customer_id': customer_id}
+                ExpressionAttributeValues={':customer_id': {'S': customer_id}},
+                **search_projection
             )
-            orders = response.get('Items', [])
         except Exception as e:
             print(f"Error querying by customer_id: {str(e)}")
             return []
-    else:
-        # Scan all orders (not ideal for production, but works for demo)
+    elif parsed_date:
+        # Query the date GSI instead of scanning the whole table
         try:
-            response = table.scan()
-            orders = response.get('Items', [])
+            orders = _collect_pages(
+                ddb.query,
+                TableName=table_name,
+                IndexName='order_date-index',
+                KeyConditionExpression='order_date = :order_date',
+                ExpressionAttributeValues={':order_date': {'S': parsed_date}},
+                **search_projection
+            )
+        except Exception as e:
+            # Tables created before order_date-index existed reject the
+            # query - fall back to the scan path below instead of losing
+            # the date match entirely
+            print(f"Error querying by order_date, falling back to scan: {str(e)}")
+            orders = None
+
+    if orders is None:
+        # No selective key available - require at least one product keyword
+        # or a parsed date so the scan has something to match against.
+        # DynamoDB contains() is case-sensitive and the stored product names
+        # are mixed-case ('iPhone 15 Pro', 'AirPods Pro'), so keyword
+        # matching stays client-side in the scoring loop below; only an
+        # exact date comparison is safe to push server-side
+        if not query_keywords and not parsed_date:
+            return []
+
+        scan_kwargs = dict(TableName=table_name, **search_projection)
+        if parsed_date and not query_keywords:
+            scan_kwargs['FilterExpression'] = 'order_date = :order_date'
+            scan_kwargs['ExpressionAttributeValues'] = {
+                ':order_date': {'S': parsed_date}
+            }
+
+        try:
+            orders = _collect_pages(ddb.scan, **scan_kwargs)
         except Exception as e:
             print(f"Error scanning orders: {str(e)}")
             return []
     
     # Filter orders based on natural query
     for order in orders:
-        match_score = 0
-        
-        # Check product name match
-        product_name = order.get('product_name', '').lower()
-        for keyword in product_keywords:
-            if keyword in query_lower and keyword in product_name:
-                match_score += 2
-        
+        product_name_lower = order.get('product_name', '').lower()
+        product_tokens = set(product_name_lower.split())
+
+        # Known product keywords present in both the query and the product name
+        name_keyword_hits = set(_KEYWORD_PATTERN.findall(product_name_lower))
+        match_score = 2 * len(query_keyword_hits & name_keyword_hits)
+
         # Check date match
         if parsed_date and order.get('order_date') == parsed_date:
             match_score += 3
-        
-        # Check for partial product name match
-        query_words = query_lower.split()
-        product_words = product_name.split()
-        for query_word in query_words:
-            if len(query_word) > 3:  # Only check words longer than 3 characters
-                for product_word in product_words:
-                    if query_word in product_word or product_word in query_word:
-                        match_score += 1
-        
+
+        # Partial product name match on the remaining query words
+        match_score += len(query_tokens & product_tokens)
+
         if match_score > 0:
             order['match_score'] = match_score
             matching_orders.append(order)
     
-    # Sort by match score (highest first)
-    matching_orders.sort(key=lambda x: x.get('match_score', 0), reverse=True)
-    
-    return matching_orders
+    # Keep only the top matches by score - a bounded heap selection instead
+    # of sorting the full candidate list
+    if len(matching_orders) > limit:
+        return heapq.nlargest(limit, matching_orders, key=lambda x: x['match_score'])
+    return sorted(matching_orders, key=lambda x: x['match_score'], reverse=True)
 
 def track_order(order_id: Optional[str] = None, tracking_id: Optional[str] = None, 
                 customer_id: Optional[str] = None, natural_query: Optional[str] = None) -> str:
@@ -157,31 +249,64 @@ def track_order(order_id: Optional[str] = None, tracking_id: Optional[str] = Non
     """
     
     try:
-        table = get_order_tracking_table()
-        
+        table_name = _get_order_table_name()
+
+        # Both identifiers - issue the lookups concurrently instead of
+        # serially, and prefer the order ID result
+        if order_id and tracking_id:
+            try:
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    order_future = executor.submit(
+                        ddb.get_item,
+                        TableName=table_name,
+                        Key={'order_id': {'S': order_id}}
+                    )
+                    tracking_future = executor.submit(
+                        ddb.query,
+                        TableName=table_name,
+                        IndexName='tracking-index',
+                        KeyConditionExpression='tracking_id = :tracking_id',
+                        ExpressionAttributeValues={':tracking_id': {'S': tracking_id}}
+                    )
+                    order_response = order_future.result()
+                    tracking_response = tracking_future.result()
+
+                if 'Item' in order_response:
+                    return format_order_status(_deserialize_item(order_response['Item']))
+                elif tracking_response['Items']:
+                    return format_order_status(_deserialize_item(tracking_response['Items'][0]))
+                else:
+                    return f"[CROSS MARK] Order {order_id} not found. Please check the order ID and try again."
+            except Exception as e:
+                return f"[CROSS MARK] Error looking up order {order_id}: {str(e)}"
+
         # Direct order ID lookup
-        if order_id:
+        elif order_id:
             try:
-                response = table.get_item(Key={'order_id': order_id})
+                response = ddb.get_item(
+                    TableName=table_name,
+                    Key={'order_id': {'S': order_id}}
+                )
                 if 'Item' in response:
-                    order = response['Item']
+                    order = _deserialize_item(response['Item'])
                     return format_order_status(order)
                 else:
                     return f"[CROSS MARK] Order {order_id} not found. Please check the order ID and try again."
             except Exception as e:
                 return f"[CROSS MARK] Error looking up order {order_id}: {str(e)}"
-        
+
         # Tracking ID lookup
         elif tracking_id:
             try:
-                response = table.query(
+                response = ddb.query(
+                    TableName=table_name,
                     IndexName='tracking-index',
                     KeyConditionExpression='tracking_id = :tracking_id',
-                    ExpressionAttributeValues={':tracking_id': tracking_id}
+                    ExpressionAttributeValues={':tracking_id': {'S': tracking_id}}
                 )
-                
+
                 if response['Items']:
-                    order = response['Items'][0]
+                    order = _deserialize_item(response['Items'][0])
                     return format_order_status(order)
                 else:
                     return f"[CROSS MARK] No order found with tracking ID {tracking_id}. Please verify the tracking number."
@@ -196,30 +321,33 @@ def track_order(order_id: Optional[str] = None, tracking_id: Optional[str] = Non
                 return f"[CROSS MARK] No orders found matching '{natural_query}'. Try being more specific or provide an order ID."
             
             elif len(matching_orders) == 1:
-                return format_order_status(matching_orders[0])
+                # The search projection only carries the matching/listing
+                # fields - re-fetch the full item for the detailed view
+                return track_order(order_id=matching_orders[0]['order_id'])
             
             else:
-                # Multiple matches - present options
+                # Multiple matches - present the top-scored options
                 response = f"[LEFT-POINTING MAGNIFYING GLASS] Found {len(matching_orders)} orders matching '{natural_query}':\n\n"
-                for i, order in enumerate(matching_orders[:5], 1):  # Limit to top 5 matches
+                for i, order in enumerate(matching_orders, 1):
                     response += f"{i}. Order {order['order_id']} - {order['product_name']} (Status: {order['status']}, Date: {order['order_date']})\n"
-                
-                if len(matching_orders) > 5:
-                    response += f"\n... and {len(matching_orders) - 5} more orders.\n"
-                
+
                 response += "\nPlease provide a specific order ID for detailed information."
                 return response
         
         # Customer ID only - show recent orders
         elif customer_id:
             try:
-                response = table.query(
+                orders = _collect_pages(
+                    ddb.query,
+                    TableName=table_name,
                     IndexName='customer-index',
                     KeyConditionExpression='customer_id = :customer_id',
-                    ExpressionAttributeValues={':customer_id': customer_id}
+                    ExpressionAttributeValues={':customer_id': {'S': customer_id}},
+                    # Only the fields shown in the recent-orders listing
+                    ProjectionExpression='order_id, product_name, order_date, #s',
+                    ExpressionAttributeNames={'#s': 'status'}
                 )
-                
-                orders = response.get('Items', [])
+
                 if not orders:
                     return f"[CROSS MARK] No orders found for customer {customer_id}."
                 
@@ -254,39 +382,43 @@ def format_order_status(order: Dict[str, Any]) -> str:
     
     status = order.get('status', 'unknown')
     emoji = status_emojis.get(status, '[PACKAGE]')
-    
-    response = f"{emoji} **Order Status: {status.title()}**\n\n"
-    response += f"[CLIPBOARD] **Order Details:**\n"
-    response += f"• Order ID: {order.get('order_id', 'N/A')}\n"
-    response += f"• Product: {order.get('product_name', 'N/A')}\n"
-    response += f"• Order Date: {order.get('order_date', 'N/A')}\n"
-    response += f"• Total: ${order.get('order_total', 0):.2f}\n"
-    
+
+    # Collect the message pieces and join once at the end rather than
+    # reallocating the string on every append
+    parts = [
+        f"{emoji} **Order Status: {status.title()}**\n\n",
+        f"[CLIPBOARD] **Order Details:**\n",
+        f"• Order ID: {order.get('order_id', 'N/A')}\n",
+        f"• Product: {order.get('product_name', 'N/A')}\n",
+        f"• Order Date: {order.get('order_date', 'N/A')}\n",
+        f"• Total: ${order.get('order_total', 0):.2f}\n"
+    ]
+
     if order.get('tracking_id'):
-        response += f"• Tracking ID: {order['tracking_id']}\n"
-    
+        parts.append(f"• Tracking ID: {order['tracking_id']}\n")
+
     if status == 'shipped' or status == 'processing':
-        response += f"• Estimated Delivery: {order.get('estimated_delivery', 'N/A')}\n"
-    
+        parts.append(f"• Estimated Delivery: {order.get('estimated_delivery', 'N/A')}\n")
+
     if order.get('shipping_address'):
         addr = order['shipping_address']
-        response += f"\n[HOUSE BUILDING] **Shipping Address:**\n"
-        response += f"{addr.get('street', '')}\n"
-        response += f"{addr.get('city', '')}, {addr.get('state', '')} {addr.get('zip_code', '')}\n"
-    
+        parts.append(f"\n[HOUSE BUILDING] **Shipping Address:**\n")
+        parts.append(f"{addr.get('street', '')}\n")
+        parts.append(f"{addr.get('city', '')}, {addr.get('state', '')} {addr.get('zip_code', '')}\n")
+
     if order.get('items') and len(order['items']) > 1:
-        response += f"\n[PACKAGE] **Items in this order:**\n"
+        parts.append(f"\n[PACKAGE] **Items in this order:**\n")
         for item in order['items']:
-            response += f"• {item.get('quantity', 1)}x {item.get('product_id', 'Unknown')} - ${item.get('price', 0):.2f}\n"
-    
+            parts.append(f"• {item.get('quantity', 1)}x {item.get('product_id', 'Unknown')} - ${item.get('price', 0):.2f}\n")
+
     # Add status-specific messages
     if status == 'delivered':
-        response += f"\n[PARTY POPPER] Your order has been delivered! We hope you enjoy your purchase."
+        parts.append(f"\n[PARTY POPPER] Your order has been delivered! We hope you enjoy your purchase.")
     elif status == 'shipped':
-        response += f"\n[OPEN MAILBOX WITH RAISED FLAG] Your order is on its way! You can track it using the tracking ID above."
+        parts.append(f"\n[OPEN MAILBOX WITH RAISED FLAG] Your order is on its way! You can track it using the tracking ID above.")
     elif status == 'processing':
-        response += f"\n[GEAR] Your order is being prepared for shipment. We'll notify you when it ships."
+        parts.append(f"\n[GEAR] Your order is being prepared for shipment. We'll notify you when it ships.")
     elif status == 'cancelled':
-        response += f"\n[BROKEN HEART] This order has been cancelled. If you have questions, please contact customer support."
-    
-    return response
+        parts.append(f"\n[BROKEN HEART] This order has been cancelled. If you have questions, please contact customer support.")
+
+    return ''.join(parts)
@@ -2,16 +2,20 @@
 import boto3
 import click
 import sys
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from utils import get_ssm_parameter, get_aws_region
+from utils import get_ssm_parameters, get_aws_region
 
 REGION = get_aws_region()
 
+_boto_config = Config(tcp_keepalive=True, retries={"mode": "standard"})
+
 identity_client = boto3.client(
     "bedrock-agentcore-control",
     region_name=REGION,
+    config=_boto_config,
 )
-ssm = boto3.client("ssm", region_name=REGION)
+ssm = boto3.client("ssm", region_name=REGION, config=_boto_config)
 
 
 def store_provider_name_in_ssm(provider_name: str):
@@ -50,24 +54,22 @@ def create_cognito_provider(provider_name: str) -> dict:
     """Create a Cognito OAuth2 credential provider."""
     try:
         click.echo("[INBOX TRAY] Fetching Cognito configuration from SSM...")
-        client_id = get_ssm_parameter(
-            "/app/customersupport/agentcore/machine_client_id"
+        # One GetParameters call covers all five values - a single round-trip
+        # and a single request signature instead of five
+        param_names = [
+            "/app/customersupport/agentcore/machine_client_id",
+            "/app/customersupport/agentcore/cognito_secret",
+            "/app/customersupport/agentcore/cognito_discovery_url",
+            "/app/customersupport/agentcore/cognito_auth_url",
+            "/app/customersupport/agentcore/cognito_token_url",
+        ]
+        params = get_ssm_parameters(param_names)
+        client_id, client_secret, issuer, auth_url, token_url = (
+            params[name] for name in param_names
         )
-        click.echo(f"[WHITE HEAVY CHECK MARK] Retrieved client ID: {client_id}")
 
-        client_secret = get_ssm_parameter(
-            "/app/customersupport/agentcore/cognito_secret"
-        )
+        click.echo(f"[WHITE HEAVY CHECK MARK] Retrieved client ID: {client_id}")
         click.echo(f"[WHITE HEAVY CHECK MARK] Retrieved client secret: {client_secret[:4]}***")
-
-        issuer = get_ssm_parameter(
-            "/app/customersupport/agentcore/cognito_discovery_url"
-        )
-        auth_url = get_ssm_parameter("/app/customersupport/agentcore/cognito_auth_url")
-        token_url = get_ssm_parameter(
-            "/app/customersupport/agentcore/cognito_token_url"
-        )
-
         click.echo(f"[WHITE HEAVY CHECK MARK] Issuer: {issuer}")
         click.echo(f"[WHITE HEAVY CHECK MARK] Authorization Endpoint: {auth_url}")
         click.echo(f"[WHITE HEAVY CHECK MARK] Token Endpoint: {token_url}")
@@ -123,10 +125,12 @@ def delete_cognito_provider(provider_name: str) -> bool:
 
 
 def list_credential_providers() -> list:
-    """List all OAuth2 credential providers."""
+    """List all OAuth2 credential providers across all pages."""
     try:
-        response = identity_client.list_oauth2_credential_providers(maxResults=20)
-        providers = response.get("credentialProviders", [])
+        paginator = identity_client.get_paginator("list_oauth2_credential_providers")
+        providers = []
+        for page in paginator.paginate():
+            providers.extend(page.get("credentialProviders", []))
         return providers
 
     except Exception as e:
@@ -135,12 +139,18 @@ def list_credential_providers() -> list:
 
 
 def find_provider_by_name(provider_name: str) -> bool:
-    """Check if provider exists by name."""
-    providers = list_credential_providers()
-    for provider in providers:
-        if provider.get("name") == provider_name:
-            return True
-    return False
+    """Check if provider exists by name, stopping at the first match."""
+    try:
+        paginator = identity_client.get_paginator("list_oauth2_credential_providers")
+        for page in paginator.paginate():
+            for provider in page.get("credentialProviders", []):
+                if provider.get("name") == provider_name:
+                    return True
+        return False
+
+    except Exception as e:
+        click.echo(f"[CROSS MARK] Error listing credential providers: {str(e)}", err=True)
+        return False
 
 
 @click.group()
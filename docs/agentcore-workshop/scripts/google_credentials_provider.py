@@ -1,39 +1,107 @@
 #!/usr/bin/python
+import sys
+
+# Static copy of the Click-generated top-level help, served before click (and
+# transitively boto3) are imported; shell-completion tooling calls --help in a
+# loop, and for that path the import cost dominates the runtime
+_STATIC_HELP = """\
+Usage: google_credentials_provider.py [OPTIONS] COMMAND [ARGS]...
+
+  AgentCore Google Credential Provider Management CLI.
+
+  Create and delete OAuth2 credential providers for Google Calendar
+  integration.
+
+Options:
+  --help  Show this message and exit.
+
+Commands:
+  create  Create a new Google OAuth2 credential provider.
+  delete  Delete a Google OAuth2 credential provider.
+  list    List all OAuth2 credential providers."""
+
+if __name__ == "__main__" and len(sys.argv) == 2 and sys.argv[1] in ("--help", "-h"):
+    print(_STATIC_HELP)
+    sys.exit(0)
+
+import functools
 import json
 import os
-import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 import click
-from botocore.exceptions import ClientError
-import boto3
-from utils import get_aws_region
 
-REGION = get_aws_region()
 CREDENTIALS_FILE = "credentials.json"
+_SSM_PARAM_NAME = "/app/customersupport/agentcore/google_provider"
+
+# Prefer the fastest installed JSON decoder: msgspec, then orjson, then the
+# stdlib. All three raise a ValueError subclass on malformed input, so the
+# parse-error handling downstream is decoder-agnostic
+try:
+    import msgspec.json
+
+    _loads = msgspec.json.decode
+except ImportError:
+    try:
+        import orjson
+
+        _loads = orjson.loads
+    except ImportError:
+        _loads = json.loads
+
+
+# boto3/botocore (and utils, which imports boto3) are imported inside the
+# lazy getters so Click parses argv - and --help returns - before any of the
+# heavyweight AWS SDK modules are loaded
+@functools.lru_cache(maxsize=1)
+def _region():
+    # Region resolution parses the AWS config/credentials files, so do it
+    # once per invocation and only when a command actually needs it
+    from utils import get_aws_region
+
+    return get_aws_region()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_identity_client():
+    import boto3
+
+    return boto3.client(
+        "bedrock-agentcore-control",
+        region_name=_region(),
+    )
 
-identity_client = boto3.client(
-    "bedrock-agentcore-control",
-    region_name=REGION,
-)
-ssm = boto3.client("ssm", region_name=REGION)
+
+@functools.lru_cache(maxsize=1)
+def _get_ssm():
+    import boto3
+
+    return boto3.client("ssm", region_name=_region())
 
 
 def store_provider_name_in_ssm(provider_name: str):
     """Store credential provider name in SSM parameter."""
-    param_name = "/app/customersupport/agentcore/google_provider"
+    from botocore.exceptions import ClientError
+
     try:
-        ssm.put_parameter(
-            Name=param_name, Value=provider_name, Type="String", Overwrite=True
+        _get_ssm().put_parameter(
+            Name=_SSM_PARAM_NAME, Value=provider_name, Type="String", Overwrite=True
         )
-        click.echo(f"[CLOSED LOCK WITH KEY] Stored provider name in SSM: {param_name}")
+        get_provider_name_from_ssm.cache_clear()
+        click.echo(f"[CLOSED LOCK WITH KEY] Stored provider name in SSM: {_SSM_PARAM_NAME}")
     except ClientError as e:
         click.echo(f"[WARNING SIGN] Failed to store provider name in SSM: {e}")
 
 
+# Cached so repeated lookups within one invocation cost a single network
+# round-trip; the mutating helpers below clear the cache
+@functools.lru_cache(maxsize=1)
 def get_provider_name_from_ssm() -> str:
     """Get credential provider name from SSM parameter."""
-    param_name = "/app/customersupport/agentcore/google_provider"
+    from botocore.exceptions import ClientError
+
     try:
-        response = ssm.get_parameter(Name=param_name)
+        response = _get_ssm().get_parameter(Name=_SSM_PARAM_NAME)
         return response["Parameter"]["Value"]
     except ClientError:
         return None
@@ -41,36 +109,63 @@ def get_provider_name_from_ssm() -> str:
 
 def delete_ssm_param():
     """Delete SSM parameter for provider."""
-    param_name = "/app/customersupport/agentcore/google_provider"
+    from botocore.exceptions import ClientError
+
     try:
-        ssm.delete_parameter(Name=param_name)
-        click.echo(f"[BROOM] Deleted SSM parameter: {param_name}")
+        _get_ssm().delete_parameter(Name=_SSM_PARAM_NAME)
+        get_provider_name_from_ssm.cache_clear()
+        click.echo(f"[BROOM] Deleted SSM parameter: {_SSM_PARAM_NAME}")
     except ClientError as e:
         click.echo(f"[WARNING SIGN] Failed to delete SSM parameter: {e}")
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_creds(path: str, mtime_ns: int, size: int) -> tuple:
+    """Parse a credentials file, cached on (path, mtime, size).
+
+    Repeated loads of an unchanged file become dict lookups; edits change
+    the mtime/size and so invalidate the entry automatically. Only the
+    fields the CLI uses are projected into the cache entry - the full
+    parsed file is collectible as soon as this returns.
+
+    Returns (has_web_section, client_id, client_secret).
+    """
+    with open(path, "rb") as f:
+        data = _loads(f.read())
+    web_config = data.get("web")
+    if not web_config:
+        return False, None, None
+    return True, web_config.get("client_id"), web_config.get("client_secret")
+
+
 def load_google_credentials(credentials_file: str) -> tuple:
     """Load Google OAuth2 credentials from JSON file."""
-    if not os.path.isfile(credentials_file):
-        click.echo(f"[CROSS MARK] Error: '{credentials_file}' file not found", err=True)
-        sys.exit(1)
-
     click.echo(f"[PAGE FACING UP] Reading credentials from {credentials_file}...")
+    # EAFP: let stat/open raise instead of pre-checking existence, which
+    # saved neither the syscall nor the TOCTOU window
     try:
-        with open(credentials_file, "r") as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
+        st = os.stat(credentials_file)
+        has_web, client_id, client_secret = _parse_creds(
+            credentials_file, st.st_mtime_ns, st.st_size
+        )
+    except FileNotFoundError:
+        click.echo(f"[CROSS MARK] Error: '{credentials_file}' file not found", err=True)
+        sys.exit(1)
+    except OSError as e:
+        # e.g. a directory path or unreadable file - anything the old
+        # isfile() pre-check would have rejected
+        click.echo(f"[CROSS MARK] Error reading '{credentials_file}': {e}", err=True)
+        sys.exit(1)
+    except ValueError as e:
+        # msgspec.DecodeError, orjson.JSONDecodeError and json.JSONDecodeError
+        # are all ValueErrors
         click.echo(f"[CROSS MARK] Error parsing JSON: {e}", err=True)
         sys.exit(1)
 
-    web_config = data.get("web")
-    if not web_config:
+    if not has_web:
         click.echo("[CROSS MARK] Error: 'web' section missing in credentials.json", err=True)
         sys.exit(1)
 
-    client_id = web_config.get("client_id")
-    client_secret = web_config.get("client_secret")
-
     if not client_id:
         click.echo("[CROSS MARK] Error: 'client_id' not found in credentials.json", err=True)
         sys.exit(1)
@@ -83,13 +178,11 @@ def load_google_credentials(credentials_file: str) -> tuple:
     return client_id, client_secret
 
 
-def create_google_provider(provider_name: str, credentials_file: str) -> dict:
-    """Create a Google OAuth2 credential provider."""
+def create_google_provider(provider_name: str, client_id: str, client_secret: str) -> dict:
+    """Create a Google OAuth2 credential provider from already-loaded credentials."""
     try:
-        client_id, client_secret = load_google_credentials(credentials_file)
-
         click.echo("[WRENCH] Creating Google OAuth2 credential provider...")
-        google_provider = identity_client.create_oauth2_credential_provider(
+        google_provider = _get_identity_client().create_oauth2_credential_provider(
             name=provider_name,
             credentialProviderVendor="GoogleOauth2",
             oauth2ProviderConfigInput={
@@ -100,10 +193,17 @@ def create_google_provider(provider_name: str, credentials_file: str) -> dict:
             },
         )
 
-        click.echo("[WHITE HEAVY CHECK MARK] Google OAuth2 credential provider created successfully")
+        # One write for the whole status block instead of a syscall per line
         provider_arn = google_provider["credentialProviderArn"]
-        click.echo(f"   Provider ARN: {provider_arn}")
-        click.echo(f"   Provider Name: {google_provider['name']}")
+        click.echo(
+            "\n".join(
+                [
+                    "[WHITE HEAVY CHECK MARK] Google OAuth2 credential provider created successfully",
+                    f"   Provider ARN: {provider_arn}",
+                    f"   Provider Name: {google_provider['name']}",
+                ]
+            )
+        )
 
         # Store provider name in SSM
         store_provider_name_in_ssm(provider_name)
@@ -115,27 +215,48 @@ def create_google_provider(provider_name: str, credentials_file: str) -> dict:
         sys.exit(1)
 
 
-def delete_google_provider(provider_name: str) -> bool:
-    """Delete a Google OAuth2 credential provider."""
+def delete_google_provider(provider_name: str) -> Optional[bool]:
+    """Delete a Google OAuth2 credential provider.
+
+    Returns True on success, None when the provider does not exist, and
+    False on any other error.
+    """
+    from botocore.exceptions import ClientError
+
     try:
         click.echo(f"[WASTEBASKET]  Deleting Google OAuth2 credential provider: {provider_name}")
 
-        identity_client.delete_oauth2_credential_provider(name=provider_name)
+        _get_identity_client().delete_oauth2_credential_provider(name=provider_name)
 
         click.echo("[WHITE HEAVY CHECK MARK] Google OAuth2 credential provider deleted successfully")
         return True
 
+    except ClientError as e:
+        # The delete call is the authoritative existence check on the
+        # no-pre-check path, so map not-found to the usual message
+        if e.response["Error"]["Code"] == "ResourceNotFoundException":
+            click.echo(f"[CROSS MARK] No credential provider found with name: {provider_name}", err=True)
+            click.echo("   Hint: Use 'list' command to see available providers")
+            return None
+        click.echo(f"[CROSS MARK] Error deleting credential provider: {str(e)}", err=True)
+        return False
+
     except Exception as e:
         click.echo(f"[CROSS MARK] Error deleting credential provider: {str(e)}", err=True)
         return False
 
 
+def iter_credential_providers():
+    """Yield OAuth2 credential providers, fetching pages lazily."""
+    paginator = _get_identity_client().get_paginator("list_oauth2_credential_providers")
+    for page in paginator.paginate():
+        yield from page.get("credentialProviders", [])
+
+
 def list_credential_providers() -> list:
     """List all OAuth2 credential providers."""
     try:
-        response = identity_client.list_oauth2_credential_providers(maxResults=20)
-        providers = response.get("credentialProviders", [])
-        return providers
+        return list(iter_credential_providers())
 
     except Exception as e:
         click.echo(f"[CROSS MARK] Error listing credential providers: {str(e)}", err=True)
@@ -144,21 +265,39 @@ def list_credential_providers() -> list:
 
 def find_provider_by_name(provider_name: str) -> bool:
     """Check if provider exists by name."""
-    providers = list_credential_providers()
-    for provider in providers:
-        if provider.get("name") == provider_name:
-            return True
-    return False
+    from botocore.exceptions import ClientError
+
+    # Optimistically ask for the provider directly - one round-trip instead
+    # of listing and scanning every record
+    try:
+        _get_identity_client().get_oauth2_credential_provider(name=provider_name)
+        return True
+    except ClientError as e:
+        if e.response["Error"]["Code"] in (
+            "ResourceNotFoundException",
+            "ValidationException",
+        ):
+            return False
+
+    # Direct lookup failed for another reason (e.g. missing permission for
+    # the get call) - fall back to streaming the listing, stopping at the
+    # first match so later pages are never fetched
+    try:
+        return any(
+            provider.get("name") == provider_name
+            for provider in iter_credential_providers()
+        )
+    except Exception as e:
+        click.echo(f"[CROSS MARK] Error listing credential providers: {str(e)}", err=True)
+        return False
 
 
 @click.group()
-@click.pass_context
-def cli(ctx):
+def cli():
     """AgentCore Google Credential Provider Management CLI.
 
     Create and delete OAuth2 credential providers for Google Calendar integration.
     """
-    ctx.ensure_object(dict)
 
 
 @cli.command()
@@ -172,11 +311,25 @@ def cli(ctx):
 )
 def create(name, credentials_file):
     """Create a new Google OAuth2 credential provider."""
-    click.echo(f"[ROCKET] Creating Google credential provider: {name}")
-    click.echo(f"[ROUND PUSHPIN] Region: {REGION}")
+    click.echo(
+        f"[ROCKET] Creating Google credential provider: {name}\n"
+        f"[ROUND PUSHPIN] Region: {_region()}"
+    )
+
+    # The file parse (local) and the SSM pre-check (network) are independent,
+    # so overlap them; the parse result is checked first so local file errors
+    # still fail fast before any SSM state is acted on
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        creds_future = executor.submit(load_google_credentials, credentials_file)
+        ssm_future = executor.submit(get_provider_name_from_ssm)
+
+        error = creds_future.exception()
+        if error is not None:
+            raise error  # SystemExit from load_google_credentials
+        client_id, client_secret = creds_future.result()
+        existing_name = ssm_future.result()
 
     # Check if provider already exists in SSM
-    existing_name = get_provider_name_from_ssm()
     if existing_name:
         click.echo(f"[WARNING SIGN]  A provider already exists in SSM: {existing_name}")
         if not click.confirm("Do you want to replace it?"):
@@ -185,11 +338,17 @@ def create(name, credentials_file):
 
     try:
         provider = create_google_provider(
-            provider_name=name, credentials_file=credentials_file
+            provider_name=name, client_id=client_id, client_secret=client_secret
+        )
+        click.echo(
+            "\n".join(
+                [
+                    "[PARTY POPPER] Google credential provider created successfully!",
+                    f"   Provider ARN: {provider['credentialProviderArn']}",
+                    f"   Provider Name: {provider['name']}",
+                ]
+            )
         )
-        click.echo("[PARTY POPPER] Google credential provider created successfully!")
-        click.echo(f"   Provider ARN: {provider['credentialProviderArn']}")
-        click.echo(f"   Provider Name: {provider['name']}")
 
     except Exception as e:
         click.echo(f"[CROSS MARK] Failed to create credential provider: {str(e)}", err=True)
@@ -206,8 +365,10 @@ def delete(name, confirm):
     """Delete a Google OAuth2 credential provider."""
 
     # If no name provided, try to get from SSM
+    name_from_ssm = False
     if not name:
         name = get_provider_name_from_ssm()
+        name_from_ssm = name is not None
         if not name:
             click.echo(
                 "[CROSS MARK] No provider name provided and couldn't read from SSM parameter",
@@ -217,52 +378,82 @@ def delete(name, confirm):
             sys.exit(1)
         click.echo(f"[OPEN BOOK] Using provider name from SSM: {name}")
 
-    click.echo(f"[LEFT-POINTING MAGNIFYING GLASS] Looking for credential provider: {name}")
+    # Only the interactive path pays for the existence pre-check, so the
+    # confirmation prompt names a provider that actually exists; with
+    # --confirm the delete call itself is the authoritative check
+    if not confirm:
+        click.echo(f"[LEFT-POINTING MAGNIFYING GLASS] Looking for credential provider: {name}")
 
-    # Check if provider exists
-    if not find_provider_by_name(name):
-        click.echo(f"[CROSS MARK] No credential provider found with name: {name}", err=True)
-        click.echo("   Hint: Use 'list' command to see available providers")
-        sys.exit(1)
+        if not find_provider_by_name(name):
+            click.echo(f"[CROSS MARK] No credential provider found with name: {name}", err=True)
+            click.echo("   Hint: Use 'list' command to see available providers")
+            sys.exit(1)
 
-    click.echo(f"[OPEN BOOK] Found provider: {name}")
+        click.echo(f"[OPEN BOOK] Found provider: {name}")
 
-    # Confirmation prompt
-    if not confirm:
         if not click.confirm(
             f"[WARNING SIGN]  Are you sure you want to delete credential provider '{name}'? This action cannot be undone."
         ):
             click.echo("[CROSS MARK] Operation cancelled")
             sys.exit(0)
 
-    if delete_google_provider(name):
+    result = delete_google_provider(name)
+    if result:
         click.echo(f"[WHITE HEAVY CHECK MARK] Credential provider '{name}' deleted successfully")
 
         # Always delete SSM parameter
         delete_ssm_param()
         click.echo("[PARTY POPPER] Credential provider and SSM parameter deleted successfully")
     else:
+        # A not-found error for a name we read out of SSM means the parameter
+        # points at a provider deleted elsewhere - drop it so the next run
+        # doesn't chase the same stale name
+        if result is None and name_from_ssm:
+            click.echo("   (SSM was stale, cleaning up)")
+            delete_ssm_param()
         click.echo("[CROSS MARK] Failed to delete credential provider", err=True)
         sys.exit(1)
 
 
 @cli.command("list")
-def list_providers():
+@click.option(
+    "--json", "as_json", is_flag=True, help="Dump the raw provider list as JSON"
+)
+def list_providers(as_json):
     """List all OAuth2 credential providers."""
     providers = list_credential_providers()
 
+    if as_json:
+        # Machine-readable path for shell pipelines (grep/jq): one buffered
+        # write of the raw records, no per-field formatting
+        try:
+            import orjson
+
+            payload = orjson.dumps(providers, option=orjson.OPT_INDENT_2)
+        except ImportError:
+            payload = json.dumps(providers, indent=2, default=str).encode()
+        sys.stdout.buffer.write(payload)
+        sys.stdout.buffer.write(b"\n")
+        return
+
     if not providers:
         click.echo("INFO:  No credential providers found")
         return
 
-    click.echo(f"[CLIPBOARD] Found {len(providers)} credential provider(s):")
-    for provider in providers:
-        click.echo(f"  • Name: {provider.get('name', 'N/A')}")
-        click.echo(f"    ARN: {provider['credentialProviderArn']}")
-        click.echo(f"    Vendor: {provider.get('credentialProviderVendor', 'N/A')}")
-        if "createdTime" in provider:
-            click.echo(f"    Created: {provider['createdTime']}")
-        click.echo()
+    # Preformat every record and write once, instead of 4-5 echo calls
+    # (each a separate write syscall) per provider
+    records = [
+        f"  • Name: {provider.get('name', 'N/A')}\n"
+        f"    ARN: {provider['credentialProviderArn']}\n"
+        f"    Vendor: {provider.get('credentialProviderVendor', 'N/A')}"
+        + (f"\n    Created: {provider['createdTime']}" if "createdTime" in provider else "")
+        for provider in providers
+    ]
+    click.echo(
+        f"[CLIPBOARD] Found {len(providers)} credential provider(s):\n"
+        + "\n\n".join(records)
+        + "\n"
+    )
 
 
 if __name__ == "__main__":
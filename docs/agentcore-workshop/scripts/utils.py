@@ -2,7 +2,8 @@ import boto3
 import json
 import yaml
 import os
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, List
 
 
 def get_ssm_parameter(name: str, with_decryption: bool = True) -> str:
@@ -13,6 +14,19 @@ def get_ssm_parameter(name: str, with_decryption: bool = True) -> str:
     return response["Parameter"]["Value"]
 
 
+def get_ssm_parameters(names: List[str], with_decryption: bool = True) -> Dict[str, str]:
+    """Fetch up to ten SSM parameters in one GetParameters call."""
+    ssm = boto3.client("ssm")
+
+    response = ssm.get_parameters(Names=list(names), WithDecryption=with_decryption)
+
+    missing = response.get("InvalidParameters")
+    if missing:
+        raise ValueError(f"SSM parameters not found: {', '.join(missing)}")
+
+    return {p["Name"]: p["Value"] for p in response["Parameters"]}
+
+
 def put_ssm_parameter(
     name: str, value: str, parameter_type: str = "String", with_encryption: bool = False
 ) -> None:
@@ -57,6 +71,7 @@ def get_aws_account_id() -> str:
     return sts.get_caller_identity()["Account"]
 
 
+@lru_cache(maxsize=1)
 def get_cognito_client_secret() -> str:
     client = boto3.client("cognito-idp")
     response = client.describe_user_pool_client(